@@ -0,0 +1,115 @@
+import logging
+import sys
+from logging.handlers import TimedRotatingFileHandler
+from colorama import Fore, init
+
+from log_utils import BufferedRotatingFileHandler, CachedTimeFormatter, ColorFormatter
+
+# Initialize colorama for cross-platform support
+init(autoreset=True)
+
+# Console color for each log level
+_LEVEL_COLORS = {
+    logging.DEBUG: Fore.CYAN,
+    logging.INFO: Fore.GREEN,
+    logging.WARNING: Fore.YELLOW,
+    logging.ERROR: Fore.RED,
+    logging.CRITICAL: Fore.MAGENTA,
+}
+
+# (module name, function name) of each calling code object, filled by _get_caller_info
+_CALLER_CACHE = {}
+
+
+class _BaseCustomLogger:
+    """
+    Shared implementation of the log_* wrappers used by CustomLogger and DataScienceLogger.
+    """
+
+    def __init__(self, name: str, log_to_file: bool = False, log_file: str = 'app.log', max_file_size: int = 5 * 1024 * 1024, backup_count: int = 5):
+        """
+        Sets up a named logger with a colored console handler and an optional rotating file.
+        
+        :param name: Name of the logger.
+        :param log_to_file: Enable logging to file.
+        :param log_file: Path to log file.
+        :param max_file_size: Max file size for log rotation in bytes.
+        :param backup_count: Number of backup files to retain.
+        """
+        # Create a logger with the given name
+        self.logger = logging.getLogger(name)
+        self.logger.propagate = False
+
+        # Bind the logger methods used on every log_* call once
+        self._is_enabled_for = self.logger.isEnabledFor
+        self._debug = self.logger.debug
+        self._info = self.logger.info
+        self._warning = self.logger.warning
+        self._error = self.logger.error
+        self._critical = self.logger.critical
+
+        if self.logger.handlers:
+            # getLogger returns the same logger for a name; its handlers are already set up
+            return
+        self.logger.setLevel(logging.DEBUG)
+        
+        # Console handler with color formatting
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.DEBUG)
+        console_formatter = ColorFormatter('%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s', colors=_LEVEL_COLORS)
+        console_handler.setFormatter(console_formatter)
+        self.logger.addHandler(console_handler)
+        
+        if log_to_file:
+            # Rotating file handler for log rotation by size
+            file_handler = BufferedRotatingFileHandler(log_file, maxBytes=max_file_size, backupCount=backup_count)
+            file_handler.setLevel(logging.DEBUG)
+            file_formatter = CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - [PID:%(process)d] [TID:%(thread)d] - %(message)s')
+            file_handler.setFormatter(file_formatter)
+            self.logger.addHandler(file_handler)
+        
+        # Optionally add TimedRotatingFileHandler for log rotation by time (daily, weekly, etc.)
+        # timed_handler = TimedRotatingFileHandler(log_file, when='D', interval=1, backupCount=backup_count)
+        # self.logger.addHandler(timed_handler)
+
+    def _get_caller_info(self):
+        """Returns class name, method, and line number of the calling function"""
+        frame = sys._getframe(2)  # 0 is _get_caller_info, 1 is calling log method, 2 is the log caller
+        code = frame.f_code
+        caller = _CALLER_CACHE.get(code)
+        if caller is None:
+            caller = _CALLER_CACHE[code] = (frame.f_globals.get('__name__', 'Unknown'), code.co_name)
+        return caller[0], caller[1], frame.f_lineno
+
+    def log_info(self, message: str):
+        if not self._is_enabled_for(logging.INFO):
+            return
+        class_name, method_name, line_number = self._get_caller_info()
+        self._info('%s.%s (Line %d): %s', class_name, method_name, line_number, message)
+
+    def log_debug(self, message: str):
+        if not self._is_enabled_for(logging.DEBUG):
+            return
+        class_name, method_name, line_number = self._get_caller_info()
+        self._debug('%s.%s (Line %d): %s', class_name, method_name, line_number, message)
+
+    def log_warning(self, message: str):
+        if not self._is_enabled_for(logging.WARNING):
+            return
+        class_name, method_name, line_number = self._get_caller_info()
+        self._warning('%s.%s (Line %d): %s', class_name, method_name, line_number, message)
+
+    def log_error(self, message: str):
+        if not self._is_enabled_for(logging.ERROR):
+            return
+        class_name, method_name, line_number = self._get_caller_info()
+        # The traceback of the exception being handled, if any, is rendered by the formatter
+        self._error('%s.%s (Line %d): %s', class_name, method_name, line_number, message,
+                    exc_info=sys.exc_info()[0] is not None)
+
+    def log_critical(self, message: str):
+        if not self._is_enabled_for(logging.CRITICAL):
+            return
+        class_name, method_name, line_number = self._get_caller_info()
+        self._critical('%s.%s (Line %d): %s', class_name, method_name, line_number, message,
+                       exc_info=sys.exc_info()[0] is not None)
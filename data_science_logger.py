@@ -1,15 +1,10 @@
 import logging
-import inspect
-import traceback
-from logging.handlers import RotatingFileHandler
-from datetime import datetime
-from colorama import Fore, Style, init
+from colorama import Fore
 import pandas as pd
 
-# Initialize colorama for cross-platform support
-init(autoreset=True)
+from base_logger import _BaseCustomLogger
 
-class DataScienceLogger:
+class DataScienceLogger(_BaseCustomLogger):
     def __init__(self, name: str, log_to_file: bool = False, log_file: str = 'data_science.log', max_file_size: int = 5 * 1024 * 1024, backup_count: int = 5):
         """
         Custom Logger for Data Science projects.
@@ -20,91 +15,50 @@ class DataScienceLogger:
         :param max_file_size: Max file size for log rotation in bytes.
         :param backup_count: Number of backup files to retain.
         """
-        # Create a logger with the given name
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)
-        
-        # Console handler with color formatting
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.DEBUG)
-        console_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s')
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
-        
-        if log_to_file:
-            # Rotating file handler for log rotation by size
-            file_handler = RotatingFileHandler(log_file, maxBytes=max_file_size, backupCount=backup_count)
-            file_handler.setLevel(logging.DEBUG)
-            file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - [PID:%(process)d] [TID:%(thread)d] - %(message)s')
-            file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
-
-    def _get_caller_info(self):
-        """Returns class name, method, and line number of the calling function"""
-        frame = inspect.stack()[2]  # 0 is _get_caller_info, 1 is calling log method, 2 is the log caller
-        module = inspect.getmodule(frame[0])
-        class_name = module.__name__ if module else 'Unknown'
-        method_name = frame.function
-        line_number = frame.lineno
-        return class_name, method_name, line_number
-
-    def _get_datetime(self):
-        """Returns current date and time in a readable format"""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    def log_info(self, message: str):
-        class_name, method_name, line_number = self._get_caller_info()
-        self.logger.info(Fore.GREEN + f'{self._get_datetime()} - {class_name}.{method_name} (Line {line_number}): {message}' + Style.RESET_ALL)
-
-    def log_debug(self, message: str):
-        class_name, method_name, line_number = self._get_caller_info()
-        self.logger.debug(Fore.CYAN + f'{self._get_datetime()} - {class_name}.{method_name} (Line {line_number}): {message}' + Style.RESET_ALL)
-
-    def log_warning(self, message: str):
-        class_name, method_name, line_number = self._get_caller_info()
-        self.logger.warning(Fore.YELLOW + f'{self._get_datetime()} - {class_name}.{method_name} (Line {line_number}): {message}' + Style.RESET_ALL)
-
-    def log_error(self, message: str):
-        class_name, method_name, line_number = self._get_caller_info()
-        error_trace = traceback.format_exc()
-        self.logger.error(Fore.RED + f'{self._get_datetime()} - {class_name}.{method_name} (Line {line_number}): {message}\n{error_trace}' + Style.RESET_ALL)
-
-    def log_critical(self, message: str):
-        class_name, method_name, line_number = self._get_caller_info()
-        critical_trace = traceback.format_exc()
-        self.logger.critical(Fore.MAGENTA + f'{self._get_datetime()} - {class_name}.{method_name} (Line {line_number}): {message}\n{critical_trace}' + Style.RESET_ALL)
+        super().__init__(name, log_to_file, log_file, max_file_size, backup_count)
 
     def log_dataframe_info(self, df: pd.DataFrame, df_name: str = "DataFrame"):
         """Log the basic information of a pandas DataFrame"""
+        if not self._is_enabled_for(logging.INFO):
+            return
         class_name, method_name, line_number = self._get_caller_info()
-        self.logger.info(Fore.BLUE + f'{self._get_datetime()} - {class_name}.{method_name} (Line {line_number}): DataFrame: {df_name}\n'
-                                     f'Shape: {df.shape}\n'
-                                     f'Columns: {list(df.columns)}\n'
-                                     f'Dtypes:\n{df.dtypes}' + Style.RESET_ALL)
+        self._info('%s.%s (Line %d): DataFrame: %s\nShape: %s\nColumns: %s\nDtypes:\n%s',
+                   class_name, method_name, line_number, df_name, df.shape, list(df.columns), df.dtypes,
+                   extra={'color': Fore.BLUE})
 
     def log_model_metrics(self, metrics: dict):
         """Log the model performance metrics"""
+        if not self._is_enabled_for(logging.INFO):
+            return
         class_name, method_name, line_number = self._get_caller_info()
-        self.logger.info(Fore.LIGHTCYAN_EX + f'{self._get_datetime()} - {class_name}.{method_name} (Line {line_number}): Model Metrics:\n'
-                                             f'{metrics}' + Style.RESET_ALL)
+        self._info('%s.%s (Line %d): Model Metrics:\n%s', class_name, method_name, line_number, metrics,
+                   extra={'color': Fore.LIGHTCYAN_EX})
 
     def log_hyperparameters(self, params: dict):
         """Log model hyperparameters"""
+        if not self._is_enabled_for(logging.INFO):
+            return
         class_name, method_name, line_number = self._get_caller_info()
-        self.logger.info(Fore.LIGHTWHITE_EX + f'{self._get_datetime()} - {class_name}.{method_name} (Line {line_number}): Model Hyperparameters:\n'
-                                              f'{params}' + Style.RESET_ALL)
+        self._info('%s.%s (Line %d): Model Hyperparameters:\n%s', class_name, method_name, line_number, params,
+                   extra={'color': Fore.LIGHTWHITE_EX})
 
     def log_training_progress(self, epoch: int, loss: float, accuracy: float):
         """Log model training progress"""
+        if not self._is_enabled_for(logging.INFO):
+            return
         class_name, method_name, line_number = self._get_caller_info()
-        self.logger.info(Fore.LIGHTGREEN_EX + f'{self._get_datetime()} - {class_name}.{method_name} (Line {line_number}): Epoch: {epoch}, '
-                                              f'Loss: {loss}, Accuracy: {accuracy}' + Style.RESET_ALL)
+        self._info('%s.%s (Line %d): Epoch: %s, Loss: %s, Accuracy: %s',
+                   class_name, method_name, line_number, epoch, loss, accuracy,
+                   extra={'color': Fore.LIGHTGREEN_EX})
 
     def log_data_preprocessing(self, step: str, details: str):
         """Log data preprocessing steps"""
+        if not self._is_enabled_for(logging.INFO):
+            return
         class_name, method_name, line_number = self._get_caller_info()
-        self.logger.info(Fore.LIGHTYELLOW_EX + f'{self._get_datetime()} - {class_name}.{method_name} (Line {line_number}): '
-                                               f'Data Preprocessing - {step}: {details}' + Style.RESET_ALL)
+        self._info('%s.%s (Line %d): Data Preprocessing - %s: %s',
+                   class_name, method_name, line_number, step, details,
+                   extra={'color': Fore.LIGHTYELLOW_EX})
 
 # Example Usage
 if __name__ == "__main__":
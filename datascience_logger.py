@@ -1,13 +1,11 @@
-import datetime
-import inspect
 import logging
 import sys
-import time
-import os
-import traceback
-import json
+import threading
 import queue
-from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from logging.handlers import QueueHandler, QueueListener
+
+import final_logger
+from log_utils import BaseJSONFormatter, BufferedRotatingFileHandler, CachedTimeFormatter, dumps_json, get_shared_logger
 
 # ANSI escape codes for colors
 class ConsoleColors:
@@ -18,27 +16,44 @@ class ConsoleColors:
     FAIL = "\033[91m"
     ENDC = "\033[0m"
 
-class JSONFormatter(logging.Formatter):
+
+# Console color for each log level
+_LEVEL_COLORS = {
+    logging.DEBUG: ConsoleColors.OKBLUE,
+    logging.INFO: ConsoleColors.OKGREEN,
+    logging.WARNING: ConsoleColors.WARNING,
+    logging.ERROR: ConsoleColors.FAIL,
+}
+
+class JSONFormatter(BaseJSONFormatter):
     """Formatter for structured JSON logging."""
-    
+
     def format(self, record):
-        log_record = {
-            'time': datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S"),
-            'level': record.levelname,
-            'file': record.pathname,
-            'line': record.lineno,
-            'message': record.msg,
-            'epoch': getattr(record, 'epoch', None),
-            'batch': getattr(record, 'batch', None),
-            'accuracy': getattr(record, 'accuracy', None),
-            'loss': getattr(record, 'loss', None)
-        }
-        return json.dumps(log_record)
-
-
-class CustomLogger(logging.Logger):
+        entries = getattr(record, 'batch_records', None)
+        if entries is None:
+            return self._to_json(record, record.msg, getattr(record, 'epoch', None), getattr(record, 'batch', None),
+                                 getattr(record, 'accuracy', None), getattr(record, 'loss', None))
+
+        # Composite record from CaptureLogs.log_batch: one JSON line per entry
+        return '\n'.join(self._to_json(record, entry.get('message'), entry.get('epoch'), entry.get('batch'),
+                                       entry.get('accuracy'), entry.get('loss')) for entry in entries)
+
+    def _to_json(self, record, message, epoch, batch, accuracy, loss):
+        log_record = self._log_record(record)
+        log_record['message'] = message
+        log_record['epoch'] = epoch
+        log_record['batch'] = batch
+        log_record['accuracy'] = accuracy
+        log_record['loss'] = loss
+        return dumps_json(log_record)
+
+
+class CustomLogger(final_logger.CustomLogger):
     """
     Custom logger for tracking data science project steps.
+
+    Reuses error() and shutdown() from final_logger.CustomLogger and adds the training
+    metric fields to info().
     """
 
     def __init__(self, name, level=logging.NOTSET):
@@ -50,7 +65,8 @@ class CustomLogger(logging.Logger):
         accuracy = kwargs.pop('accuracy', None)
         loss = kwargs.pop('loss', None)
 
-        record = self.makeRecord(self.name, logging.INFO, *inspect.stack()[1][1:3], msg, args, None, None)
+        frame = sys._getframe(1)
+        record = self.makeRecord(self.name, logging.INFO, frame.f_code.co_filename, frame.f_lineno, msg, args, None, None)
         record.epoch = epoch
         record.batch = batch
         record.accuracy = accuracy
@@ -63,39 +79,18 @@ class CustomLogger(logging.Logger):
     def warning(self, msg, *args, **kwargs):
         self._log_with_color(logging.WARNING, msg, *args, **kwargs)
 
-    def error(self, msg, *args, **kwargs):
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-        _, _, exc_traceback = sys.exc_info()
-        if exc_traceback:
-            file_name, line_number, func_name, context = traceback.extract_tb(exc_traceback)[-1]
-            msg += f"\n Exception in {file_name}, Line {line_number}, in {func_name}: {context}"
-
-        file_name, line_num = self.__get_call_info()
-        msg = f"{file_name} {line_num} : {timestamp} ERROR: {msg}"
-        super().info(msg, *args, **kwargs)
-
     def _log_with_color(self, level, msg, *args, **kwargs):
-        color = {
-            logging.DEBUG: ConsoleColors.OKBLUE,
-            logging.INFO: ConsoleColors.OKGREEN,
-            logging.WARNING: ConsoleColors.WARNING,
-            logging.ERROR: ConsoleColors.FAIL,
-        }.get(level, ConsoleColors.ENDC)
+        color = _LEVEL_COLORS.get(level, ConsoleColors.ENDC)
 
         msg = f"{color}{msg}{ConsoleColors.ENDC}"
         self.log(level, msg, *args, **kwargs)
 
-    def __get_call_info(self):
-        stack = inspect.stack()
-        file_name = stack[2][1]
-        line_num = stack[2][2]
-        return file_name, line_num
-
 
 class CaptureLogs:
     _shared_logger = None
     _log_file_name = None
     _created_loggers = {}
+    _lock = threading.Lock()
     queue_listener = None
 
     @classmethod
@@ -103,13 +98,7 @@ class CaptureLogs:
         """
         This function returns the logger instance for logging during data science processes.
         """
-        if cls._shared_logger is None and log_file_name not in cls._created_loggers:
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-            log_file_name = f'{log_file_name}_{timestamp}.log'
-            cls._shared_logger = cls.setup_logger(log_file_name, log_level, structured_logging)
-            cls._log_file_name = log_file_name
-            
-        return cls._shared_logger
+        return get_shared_logger(cls, log_file_name, log_level, structured_logging)
 
     @classmethod
     def setup_logger(cls, log_file_name, log_level=logging.DEBUG, structured_logging=True):
@@ -123,12 +112,12 @@ class CaptureLogs:
 
         # File handler (with log rotation)
         if structured_logging:
-            file_handler = RotatingFileHandler(log_file_name, maxBytes=10 * 1024 * 1024, backupCount=5)
+            file_handler = BufferedRotatingFileHandler(log_file_name, maxBytes=10 * 1024 * 1024, backupCount=5)
             json_formatter = JSONFormatter()
             file_handler.setFormatter(json_formatter)
         else:
-            file_handler = RotatingFileHandler(log_file_name, maxBytes=10 * 1024 * 1024, backupCount=5)
-            file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            file_handler = BufferedRotatingFileHandler(log_file_name, maxBytes=10 * 1024 * 1024, backupCount=5)
+            file_formatter = CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s')
             file_handler.setFormatter(file_formatter)
         file_handler.setLevel(log_level)
 
@@ -138,22 +127,37 @@ class CaptureLogs:
         console_handler.setFormatter(console_formatter)
         console_handler.setLevel(log_level)
 
-        # Add handlers to logger
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
-
-        # Async logging with QueueHandler
-        log_queue = queue.Queue()
+        # Async logging with QueueHandler; the listener thread is the only one writing to
+        # the file and console handlers, so they are not attached to the logger itself
+        log_queue = queue.SimpleQueue()
         queue_handler = QueueHandler(log_queue)
         logger.addHandler(queue_handler)
 
         # Start QueueListener for async logging
-        cls.queue_listener = QueueListener(log_queue, file_handler, console_handler)
+        cls.queue_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
         cls.queue_listener.start()
 
         cls._shared_logger = logger
         return logger
 
+    @classmethod
+    def log_batch(cls, records, level=logging.INFO):
+        """
+        Logs a list of metric dicts (message, epoch, batch, accuracy, loss) as a single record.
+
+        The structured file handler writes one JSON line per entry, other handlers get the
+        messages joined by newlines.
+        """
+        logger = cls.get_logger()
+        if not records or not logger.isEnabledFor(level):
+            return
+
+        frame = sys._getframe(1)
+        msg = '\n'.join(str(entry.get('message', '')) for entry in records)
+        record = logger.makeRecord(logger.name, level, frame.f_code.co_filename, frame.f_lineno, msg, None, None)
+        record.batch_records = records
+        logger.handle(record)
+
     @classmethod
     def get_log_file_name(cls):
         return cls._log_file_name
@@ -174,13 +178,20 @@ if __name__ == "__main__":
     dataset_size = 50000
     logger.info(f"Loaded dataset with {dataset_size} samples")
 
-    # Example log for tracking model training
+    # Example log for tracking model training, logging each epoch's batches in one go
     for epoch in range(10):
+        batch_logs = []
         for batch in range(100):
             loss = 0.05 * (100 - batch)  # Simulated loss
             accuracy = 0.9 + (0.01 * batch)  # Simulated accuracy
-            logger.info(f"Epoch {epoch}, Batch {batch}, Loss: {loss}, Accuracy: {accuracy}", 
-                        epoch=epoch, batch=batch, loss=loss, accuracy=accuracy)
+            batch_logs.append({
+                'message': f"Epoch {epoch}, Batch {batch}, Loss: {loss}, Accuracy: {accuracy}",
+                'epoch': epoch,
+                'batch': batch,
+                'loss': loss,
+                'accuracy': accuracy
+            })
+        CaptureLogs.log_batch(batch_logs)
 
     # Example log for errors
     try:
@@ -1,18 +1,43 @@
-import datetime
-import inspect
+import functools
 import logging
 import sys
 import time
 import os
-import traceback
-import json
+import threading
 import queue
-from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import re
+from logging.handlers import QueueHandler, QueueListener
 
+from log_utils import (BaseJSONFormatter, BufferedRotatingFileHandler, CachedTimeFormatter, ColorFormatter,
+                       StandaloneLogger, count_down, dumps_json, format_timestamp, get_shared_logger,
+                       level_color_table, with_exception_site)
 
-class CustomFormatter(logging.Formatter):
+
+# Words masked by SensitiveDataFilter ("password" anywhere, as before; the rest as whole words)
+_SENSITIVE_RE = re.compile(r'passw(?:or)?d|\b(?:token|api[_-]?key|secret)\b', re.IGNORECASE)
+
+# Context attached to every log record
+_USER_ID = "12345"
+
+# Clock read on every CustomLogger call, bound once instead of looked up on the time module
+_time = time.time
+
+
+@functools.lru_cache(maxsize=4096)
+def _call_site_prefix(file_name, line_num, escape):
+    """
+    Returns the "<file> <line> : " prefix of CustomLogger messages logged from one call site.
+
+    With ``escape`` set, '%' is doubled so the prefix survives the %-formatting of a
+    message that has arguments.
+    """
+    prefix = f"{file_name} {line_num} : "
+    return prefix.replace('%', '%%') if escape else prefix
+
+
+class CustomFormatter(ColorFormatter):
     """Custom formatter to add colors to console logs based on log level."""
-    
+
     # ANSI escape codes for colors
     COLORS = {
         'DEBUG': "\033[94m",    # Blue
@@ -22,96 +47,111 @@ class CustomFormatter(logging.Formatter):
         'RESET': "\033[0m"      # Reset
     }
 
-    def format(self, record):
-        log_msg = super().format(record)
-        color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        reset = self.COLORS['RESET']
-        return f"{color}{log_msg}{reset}"
+    RESET = COLORS['RESET']
+
+    # Colors indexed by ``levelno // 10``: NOTSET, DEBUG, INFO, WARNING, ERROR, CRITICAL
+    LEVEL_COLORS = level_color_table(COLORS)
 
 
-class JSONFormatter(logging.Formatter):
+class JSONFormatter(BaseJSONFormatter):
     """Formatter for structured JSON logging."""
-    
+
     def format(self, record):
-        log_record = {
-            'time': datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S"),
-            'level': record.levelname,
-            'file': record.pathname,
-            'line': record.lineno,
-            'message': record.msg
-        }
-        return json.dumps(log_record)
+        log_record = self._log_record(record)
+        log_record['message'] = record.msg
+        return dumps_json(log_record)
 
 
 class SensitiveDataFilter(logging.Filter):
     """Filter to mask sensitive data in log messages."""
     
     def filter(self, record):
-        record.msg = str(record.msg).replace("password", "******")  # Mask sensitive info
+        msg = record.msg
+        if isinstance(msg, str) and _SENSITIVE_RE.search(msg):
+            record.msg = _SENSITIVE_RE.sub("******", msg)  # Mask sensitive info
+        args = record.args
+        if isinstance(args, tuple) and any(isinstance(arg, str) and _SENSITIVE_RE.search(arg) for arg in args):
+            record.args = tuple(_SENSITIVE_RE.sub("******", arg) if isinstance(arg, str) else arg for arg in args)
         return True
 
 
-class ContextFilter(logging.Filter):
-    """Filter to add contextual information to log records."""
-    
-    def filter(self, record):
+def _install_context_record_factory():
+    """
+    Wraps the LogRecord factory so contextual information is set when a record is created.
+    """
+    make_record = logging.getLogRecordFactory()
+
+    def record_factory(*args, **kwargs):
+        record = make_record(*args, **kwargs)
         # Example: Add user ID or session info to each log record
-        record.user_id = "12345"
-        return True
+        record.user_id = _USER_ID
+        return record
 
+    logging.setLogRecordFactory(record_factory)
 
-class CustomLogger(logging.Logger):
+
+class CustomLogger(StandaloneLogger):
     """
     Custom logger class with additional functionality
+
+    Records are attributed to the caller of info()/debug()/warning()/error() (``stacklevel=2``),
+    so ``pathname`` and ``lineno`` name the logging call rather than this class.
     """
 
     def __init__(self, name, level=logging.NOTSET):
         super().__init__(name, level)
-        
+
     def info(self, msg, *args, **kwargs):
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+        if not self.isEnabledFor(logging.INFO):
+            return
+        timestamp = format_timestamp(_time())
         file_name, line_num = self.__get_call_info()
-        msg = f"{file_name} {line_num} : {timestamp} INFO: {msg}"
-        super().info(msg, *args, **kwargs)
+        kwargs.setdefault('stacklevel', 2)
+        super().info(_call_site_prefix(file_name, line_num, bool(args)) + timestamp + " INFO: " + str(msg),
+                     *args, **kwargs)
         
     def debug(self, msg, *args, **kwargs):
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+        if not self.isEnabledFor(logging.DEBUG):
+            return
+        timestamp = format_timestamp(_time())
         file_name, line_num = self.__get_call_info()
-        msg = f"{file_name} {line_num} : {timestamp} DEBUG: {msg}"
-        super().info(msg, *args, **kwargs)
+        kwargs.setdefault('stacklevel', 2)
+        super().debug(_call_site_prefix(file_name, line_num, bool(args)) + timestamp + " DEBUG: " + str(msg),
+                      *args, **kwargs)
     
     def warning(self, msg, *args, **kwargs):
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+        if not self.isEnabledFor(logging.WARNING):
+            return
+        timestamp = format_timestamp(_time())
         file_name, line_num = self.__get_call_info()
-        msg = f"{file_name} {line_num} : {timestamp} WARNING: {msg}"
-        super().info(msg, *args, **kwargs)
+        kwargs.setdefault('stacklevel', 2)
+        super().warning(_call_site_prefix(file_name, line_num, bool(args)) + timestamp + " WARNING: " + str(msg),
+                        *args, **kwargs)
         
     def error(self, msg, *args, **kwargs):
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-        _, _, exc_traceback = sys.exc_info()
-        if exc_traceback:
-            file_name, line_number, func_name, context = traceback.extract_tb(exc_traceback)[-1]
-            msg += f"\n Exception in {file_name}, Line {line_number}, in {func_name}: {context}"
-            
+        if not self.isEnabledFor(logging.ERROR):
+            return
+        timestamp = format_timestamp(_time())
+        msg = with_exception_site(msg, bool(args))
         file_name, line_num = self.__get_call_info()
-        msg = f"{file_name} {line_num} : {timestamp} ERROR: {msg}"
-        super().info(msg, *args, **kwargs)
+        kwargs.setdefault('stacklevel', 2)
+        super().error(_call_site_prefix(file_name, line_num, bool(args)) + timestamp + " ERROR: " + msg,
+                      *args, **kwargs)
 
     @staticmethod
     def shutdown():
         logging.shutdown()
         
     def __get_call_info(self):
-        stack = inspect.stack()
-        file_name = stack[2][1]
-        line_num = stack[2][2]
-        return file_name, line_num
+        frame = sys._getframe(2)
+        return frame.f_code.co_filename, frame.f_lineno
 
 
 class CaptureConsoleLogs:
     _shared_logger = None
     _log_file_name = None
     _created_loggers = {}
+    _lock = threading.Lock()
     queue_listener = None
 
     @classmethod
@@ -120,18 +160,14 @@ class CaptureConsoleLogs:
         This function returns the logger instance.
         """
         environment = os.getenv("ENV", "development")
-        if cls._shared_logger is None and log_file_name not in cls._created_loggers:
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-            log_file_name = f'{log_file_name}_{timestamp}.log'
-            cls._shared_logger = cls.setup_logger(log_file_name, log_level, structured_logging)
-            cls._log_file_name = log_file_name
+        logger = get_shared_logger(cls, log_file_name, log_level, structured_logging)
 
         if environment == "production":
-            cls._shared_logger.setLevel(logging.WARNING)
+            logger.setLevel(logging.WARNING)
         else:
-            cls._shared_logger.setLevel(log_level)
+            logger.setLevel(log_level)
             
-        return cls._shared_logger
+        return logger
 
     @classmethod
     def setup_logger(cls, log_file_name, log_level=logging.DEBUG, structured_logging=False):
@@ -145,12 +181,12 @@ class CaptureConsoleLogs:
 
         # File handler (with log rotation)
         if structured_logging:
-            file_handler = RotatingFileHandler(log_file_name, maxBytes=10 * 1024 * 1024, backupCount=5)
+            file_handler = BufferedRotatingFileHandler(log_file_name, maxBytes=10 * 1024 * 1024, backupCount=5)
             json_formatter = JSONFormatter()
             file_handler.setFormatter(json_formatter)
         else:
-            file_handler = RotatingFileHandler(log_file_name, maxBytes=10 * 1024 * 1024, backupCount=5)
-            file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            file_handler = BufferedRotatingFileHandler(log_file_name, maxBytes=10 * 1024 * 1024, backupCount=5)
+            file_formatter = CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s')
             file_handler.setFormatter(file_formatter)
         file_handler.setLevel(log_level)
 
@@ -160,21 +196,18 @@ class CaptureConsoleLogs:
         console_handler.setFormatter(console_formatter)
         console_handler.setLevel(log_level)
 
-        # Add filters (for sensitive data and context)
+        # Add filter for sensitive data; context is attached by the record factory
         logger.addFilter(SensitiveDataFilter())
-        logger.addFilter(ContextFilter())
-
-        # Add both handlers to logger
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        _install_context_record_factory()
 
-        # Async logging with QueueHandler
-        log_queue = queue.Queue()
+        # Async logging with QueueHandler; the listener thread is the only one writing to
+        # the file and console handlers, so they are not attached to the logger itself
+        log_queue = queue.SimpleQueue()
         queue_handler = QueueHandler(log_queue)
         logger.addHandler(queue_handler)
 
         # Start QueueListener for async logging
-        cls.queue_listener = QueueListener(log_queue, file_handler, console_handler)
+        cls.queue_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
         cls.queue_listener.start()
 
         cls._shared_logger = logger
@@ -191,13 +224,7 @@ class CaptureConsoleLogs:
         cls._shared_logger.shutdown()
 
     def count_down(self, duration):
-        while duration:
-            minutes, secs = divmod(duration, 60)
-            timer = f'{minutes} min :{secs} secs'
-            if duration % 10 == 0:
-                self.get_logger().info(f"Wait for: {timer}")
-            time.sleep(1)
-            duration -= 1
+        count_down(self.get_logger(), duration)
 
 
 # Example usage:
@@ -0,0 +1,349 @@
+import json
+import linecache
+import logging
+import os
+import sys
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard library encoder is used without it
+    orjson = None
+
+
+TIMESTAMP_FORMAT = "%Y-%m-%d-%H-%M-%S"
+
+# Line appended to error messages logged while an exception is handled, filled in with exception_site()
+EXCEPTION_SITE_FORMAT = "\n Exception in %s, Line %d, in %s: %s"
+
+# (second, formatted text) of the most recently formatted timestamp
+_last_timestamp = (None, "")
+
+# Compact JSON encoder shared by every structured log line
+_json_encoder = json.JSONEncoder(separators=(',', ':'))
+
+
+def format_timestamp(created):
+    """
+    Returns the epoch time ``created`` formatted with TIMESTAMP_FORMAT.
+
+    The formatted text is reused for every call that falls within the same second.
+    """
+    global _last_timestamp
+    second = int(created)
+    cached_second, text = _last_timestamp
+    if second != cached_second:
+        text = time.strftime(TIMESTAMP_FORMAT, time.localtime(second))
+        _last_timestamp = (second, text)
+    return text
+
+
+def exception_site(tb):
+    """
+    Returns ``(file name, line number, function name, source line)`` of the innermost frame
+    of traceback ``tb``, the same values as ``traceback.extract_tb(tb)[-1]``.
+
+    Only the last frame is looked at, no FrameSummary is built for the others.
+    """
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    code = tb.tb_frame.f_code
+    file_name, line_number = code.co_filename, tb.tb_lineno
+    return file_name, line_number, code.co_name, linecache.getline(file_name, line_number).strip()
+
+
+
+def with_exception_site(msg, escape):
+    """
+    Returns ``msg`` as a string with the EXCEPTION_SITE_FORMAT line of the exception being
+    handled appended, or unchanged when no exception is being handled.
+
+    With ``escape`` set, '%' in the appended line is doubled: the source line may contain '%'
+    and the arguments of the logging call are applied to the whole message.
+    """
+    msg = str(msg)
+    exc_traceback = sys.exc_info()[2]
+    if exc_traceback is not None:
+        site = EXCEPTION_SITE_FORMAT % exception_site(exc_traceback)
+        msg += site.replace('%', '%%') if escape else site
+    return msg
+
+def dumps_json(obj):
+    """
+    Returns ``obj`` serialized as a compact, single line JSON string.
+
+    Uses orjson when it is installed and the standard library json module otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return _json_encoder.encode(obj)
+
+
+def get_shared_logger(capture_cls, log_file_name, *setup_args):
+    """
+    Returns the shared logger of a CaptureConsoleLogs/CaptureLogs class, setting it up on first use
+    with ``capture_cls.setup_logger("<log_file_name>_<timestamp>.log", *setup_args)``.
+    """
+    if capture_cls._shared_logger is None:
+        with capture_cls._lock:
+            # Check again under the lock, another thread may have set the logger up meanwhile
+            if capture_cls._shared_logger is None and log_file_name not in capture_cls._created_loggers:
+                timestamp = format_timestamp(time.time())
+                capture_cls._log_file_name = f'{log_file_name}_{timestamp}.log'
+                capture_cls._shared_logger = capture_cls.setup_logger(capture_cls._log_file_name, *setup_args)
+                capture_cls._created_loggers[log_file_name] = capture_cls._shared_logger
+
+    return capture_cls._shared_logger
+
+
+def count_down(logger, duration):
+    """
+    Waits ``duration`` seconds, logging the remaining time on ``logger`` every 10 seconds.
+    """
+    # Only every 10th second is logged, so sleep straight from one logged second to the next.
+    # Sleeping up to fixed monotonic deadlines keeps the time spent logging from adding up.
+    deadline = time.monotonic() + duration
+    for remaining in range(duration - duration % 10, 0, -10):
+        time.sleep(max(0, deadline - remaining - time.monotonic()))
+        minutes, secs = divmod(remaining, 60)
+        logger.info("Wait for: %d min :%d secs", minutes, secs)
+    time.sleep(max(0, deadline - time.monotonic()))
+
+
+class StandaloneLogger(logging.Logger):
+    """
+    Logger meant to be created directly rather than through ``logging.getLogger``.
+
+    isEnabledFor caches its answer per level in ``self._cache``. Such loggers are not in the
+    manager's loggerDict, so Manager._clear_cache() never resets theirs; setLevel does it
+    here so a level change is not ignored.
+    """
+
+    def setLevel(self, level):
+        super().setLevel(level)
+        self._cache.clear()
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that batches writes and tracks the file size in memory.
+
+    Records go through a write buffer of ``buffer_size`` bytes instead of being flushed one
+    by one. The buffer is flushed when it fills up, when a record at ``flush_level`` or above
+    is emitted, every ``flush_interval`` seconds by a background thread while unflushed
+    records are pending, and when the handler is closed. Rollover is decided from a running
+    count of the encoded bytes written rather than by querying the stream position of the
+    file for every record.
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None, delay=False,
+                 buffer_size=64 * 1024, flush_interval=0.1, flush_level=logging.WARNING):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._bytes_written = 0
+        self._pending = False
+        self._stop_flushing = threading.Event()
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
+        self._flush_thread = None
+        if flush_interval:
+            self._flush_thread = threading.Thread(target=self._flush_periodically, daemon=True,
+                                                  name=f'{type(self).__name__}-flush')
+            self._flush_thread.start()
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def _flush_periodically(self):
+        while not self._stop_flushing.wait(self.flush_interval):
+            # Never wait for the handler lock: logging.shutdown() holds it while closing, and
+            # a flush skipped while a record is being emitted is retried on the next tick
+            if self._pending and self.lock.acquire(blocking=False):
+                try:
+                    if not self._stop_flushing.is_set() and self.stream is not None:
+                        self.flush()
+                finally:
+                    self.lock.release()
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0:
+                size = len(msg.encode(self.stream.encoding, self.stream.errors))
+                if self._bytes_written + size >= self.maxBytes:
+                    self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                self._bytes_written += size
+            self.stream.write(msg)
+            self._pending = True
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self._pending = False
+        super().flush()
+
+    def close(self):
+        # The daemon flush thread exits on its own once stopped; joining it here could
+        # deadlock, since close() may run with the handler lock held
+        self._stop_flushing.set()
+        super().close()
+
+
+class BaseJSONFormatter(logging.Formatter):
+    """
+    Base of the JSON formatters: fills the fields every JSON log line has.
+
+    Subclasses add their own fields to the dict returned by ``_log_record()`` and pass it to
+    ``dumps_json()``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Per-thread dict reused for every record instead of building a new one
+        self._local = threading.local()
+
+    def _log_record(self, record):
+        log_record = getattr(self._local, 'log_record', None)
+        if log_record is None:
+            log_record = self._local.log_record = {}
+        log_record['time'] = format_timestamp(record.created)
+        log_record['level'] = record.levelname
+        log_record['file'] = record.pathname
+        log_record['line'] = record.lineno
+        return log_record
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that formats ``%(asctime)s`` once per second instead of once per record.
+
+    The text for the current second is reused by every record created within it; without a
+    ``datefmt`` the milliseconds are still added per record (unless ``default_msec_format`` is
+    unset), as logging.Formatter does.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, datefmt, formatted text) of the most recently formatted time
+        self._last_time = (None, None, "")
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, cached_datefmt, text = self._last_time
+        if second != cached_second or datefmt != cached_datefmt:
+            text = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._last_time = (second, datefmt, text)
+        if datefmt or not self.default_msec_format:
+            return text
+        return self.default_msec_format % (text, record.msecs)
+
+
+def level_color_table(colors):
+    """
+    Returns ``colors`` (log level -> color code) as a tuple indexed by ``levelno // 10``:
+    NOTSET, DEBUG, INFO, WARNING, ERROR, CRITICAL.
+
+    Levels may be given as numbers (``logging.INFO``) or names (``'INFO'``); other keys, such
+    as a ``'RESET'`` entry, are ignored.
+    """
+    colors = colors or {}
+    return tuple(colors.get(index * 10, colors.get(logging.getLevelName(index * 10), ''))
+                 for index in range(6))
+
+
+def _level_color(level_colors, levelno):
+    index = levelno // 10
+    return level_colors[index] if 0 <= index < len(level_colors) else ''
+
+
+class ColorFormatter(CachedTimeFormatter):
+    """
+    Formatter that wraps each console line in the ANSI color of its log level.
+
+    ``colors`` maps log levels to color codes and defaults to the class's ``COLORS``;
+    subclasses set ``COLORS`` and the matching ``LEVEL_COLORS = level_color_table(COLORS)``.
+    A record carrying a ``color`` attribute (e.g. ``logger.info(msg, extra={'color': Fore.BLUE})``)
+    uses that color instead.
+    """
+
+    RESET = "\033[0m"
+
+    COLORS = {}
+
+    # Colors indexed by ``levelno // 10``: NOTSET, DEBUG, INFO, WARNING, ERROR, CRITICAL
+    LEVEL_COLORS = level_color_table(COLORS)
+
+    def __init__(self, fmt=None, datefmt=None, colors=None):
+        super().__init__(fmt, datefmt)
+        self.level_colors = self.LEVEL_COLORS if colors is None else level_color_table(colors)
+
+    def format(self, record):
+        log_msg = super().format(record)
+        color = getattr(record, 'color', None)
+        if color is None:
+            color = _level_color(self.level_colors, record.levelno)
+        return color + log_msg + self.RESET
+
+
+class ColorStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler for console output that writes each record in the color of its log level.
+
+    ``colors`` maps log levels to color codes, as for ColorFormatter. The color codes are
+    written around the formatted line rather than joined into it.
+    """
+
+    def __init__(self, stream=None, colors=None):
+        super().__init__(stream)
+        self.level_colors = level_color_table(colors)
+        self._suffix = ColorFormatter.RESET + self.terminator
+
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+            stream = self.stream
+            stream.write(_level_color(self.level_colors, record.levelno))
+            stream.write(msg)
+            stream.write(self._suffix)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Regression check: logging.shutdown() must not hang while the flush thread waits on the handler lock
+
+if __name__ == "__main__":
+    import tempfile
+    import weakref
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        handler = BufferedRotatingFileHandler(os.path.join(log_dir, 'check.log'), flush_interval=0.01)
+        check_logger = StandaloneLogger('log_utils_check')
+        check_logger.addHandler(handler)
+        shut_down = threading.Event()
+
+        def shutdown_with_pending_flush():
+            with handler.lock:
+                check_logger.info("pending flush")
+                time.sleep(0.1)  # let the flush thread find the lock busy
+                logging.shutdown([weakref.ref(handler)])
+            shut_down.set()
+
+        threading.Thread(target=shutdown_with_pending_flush, daemon=True).start()
+        assert shut_down.wait(5), "logging.shutdown() hung on BufferedRotatingFileHandler.close()"
+        print("logging.shutdown() with a pending flush: ok")
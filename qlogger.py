@@ -1,127 +1,127 @@
-import datetime
-import inspect
+import atexit
 import logging
-import sys
-import time
-import os
-import traceback
+import threading
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from log_utils import (TIMESTAMP_FORMAT, BufferedRotatingFileHandler, CachedTimeFormatter, ColorStreamHandler,
+                       StandaloneLogger, count_down, get_shared_logger, level_color_table, with_exception_site)
+from log_utils import ColorFormatter as _BaseColorFormatter
+
+# Caller path and line, timestamp and level in front of every message
+_LOG_FORMAT = '%(pathname)s %(lineno)d : %(asctime)s %(levelname)s: %(message)s'
 
-class CustomLogger(logging.Logger):
-    """
-    This class is use to add custome define logger
 
-    Args:
-        logging (_type_): _description_
+class CustomLogger(StandaloneLogger):
     """
-    
+    This class is used to add custom-defined logger
+    """
+
     def __init__(self, name, level=logging.NOTSET):
         super().__init__(name, level)
-        
-    def info(self, msg, *args, **kwargs):
-        """
-        this function is use to log the debug messege
-        """  
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-        file_name, line_num = self.__get_call_info()
-        msg = f"{file_name} {line_num} : {timestamp} INFO: {msg}"
-        super().info(msg, *args, **kwargs)
-        
-    def debug(self, msg, *args, **kwargs):
-        """
-        This Function is use to Log the Debug msg
-        """
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-        file_name, line_num = self.__get_call_info()
-        msg = f"{file_name} {line_num} : {timestamp} DEBUG: {msg}"
-        super().info(msg, *args, **kwargs)
-    
-    def warning(self, msg, *args, **kwargs):
-        """
-        This Function is use to Log the Warning msg
-        """
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-        file_name, line_num = self.__get_call_info()
-        msg = f"{file_name} {line_num} : {timestamp} WARNING: {msg}"
-        super().info(msg, *args, **kwargs)
-        
+
     def error(self, msg, *args, **kwargs):
         """
-        This Function is use to Log the Error msg
+        This function is used to log the error message
         """
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-        _, _, exc_traceback = sys.exc_info()
-        if exc_traceback:
-            file_name, line_number, func_name, context= traceback.extract_tb(exc_traceback)[-1]
-            msg += f"\n Exception in{file_name}, Line {line_number}, in {func_name}: {context}"
-            
-        file_name, line_num = self.__get_call_info()
-        msg = f"{file_name} {line_num} : {timestamp} ERROR: {msg}"
-        super().info(msg, *args, **kwargs)
-        
+        if not self.isEnabledFor(logging.ERROR):
+            return
+        msg = with_exception_site(msg, bool(args))
+        # Attribute the record to the caller of error() rather than to this method
+        kwargs.setdefault('stacklevel', 2)
+        super().error(msg, *args, **kwargs)
+
     @staticmethod
     def shutdown():
         """
-        This function is use to shutdown the logging
+        This function is used to shut down the logging
         """
         logging.shutdown()
-        
-    def __get_call_info(self):
-        stack = inspect.stack()
-        
-        # stack[1] gives privious function ("info" in our case)
-        # stack [2] goves before privious function and so on
-        
-        file_name = stack[2][1]
-        line_num = stack[2][2]
-        # func = stack[2][3]
-        
-        return file_name, line_num
-    
+
+
+class ColorFormatter(_BaseColorFormatter):
+    """
+    Formatter for colorizing the logs for console output.
+
+    Kept as a compatibility export (also re-exported by q_logger1 and q_logger2): the console
+    handler of CaptureConsoleLogs colors its lines with ColorStreamHandler and ``COLORS``.
+    """
+
+    COLORS = {
+        logging.DEBUG: "\033[94m",  # Blue for debug
+        logging.INFO: "\033[92m",   # Green for info
+        logging.WARNING: "\033[93m",  # Yellow for warning
+        logging.ERROR: "\033[91m",  # Red for error
+        logging.CRITICAL: "\033[95m"  # Magenta for critical
+    }
+
+    # Colors indexed by ``levelno // 10``: NOTSET, DEBUG, INFO, WARNING, ERROR, CRITICAL
+    LEVEL_COLORS = level_color_table(COLORS)
+
 
 class CaptureConsoleLogs:
     """
-    this class have function to capture the console log
+    This class has functions to capture the console log
     """
     _shared_logger = None
     _log_file_name = None
     _created_loggers = {}
-    
+    _lock = threading.Lock()
+    queue_listener = None
+
     @classmethod
     def get_logger(cls):
         """
         This function returns the logger for logging
         """
-        log_file_name = 'test_console'
-        if cls._shared_logger is None and log_file_name not in cls._created_loggers:
-            timestamp=datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-            log_file_name = f'{log_file_name}_{timestamp}.log'
-            cls._shared_logger = cls.setup_logger(log_file_name)
-            cls._log_file_name =  log_file_name
-            
-        return cls._shared_logger
-    
+        return get_shared_logger(cls, 'test_console')
+
     @classmethod
     def setup_logger(cls, log_file_name):
         """
-        this function sets up the logger for the file handler and console handeler
-
-        Args:
-            log_file_name (_type_): _description_
+        This function sets up the logger with both file and console handlers.
         """
         if cls._shared_logger is not None:
             return cls._shared_logger
+        
         logger = CustomLogger("custom_logger", logging.DEBUG)
         logger.setLevel(logging.DEBUG)
-        file_hendler = logging.FileHandler(log_file_name)
-        file_hendler.setLevel(logging.DEBUG)
-        console_hendler = logging.StreamHandler()
-        console_hendler.setLevel(logging.DEBUG)
-        logger.addHandler(file_hendler)
-        logger.addHandler(console_hendler)
-        cls._shared_logger = logger
+
+        # Both handlers write the same line, the console handler adds the colors itself
+        formatter = CachedTimeFormatter(_LOG_FORMAT, TIMESTAMP_FORMAT)
+
+        # File handler (plain text logs)
+        file_handler = BufferedRotatingFileHandler(log_file_name)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+        
+        # Console handler (colored logs)
+        console_handler = ColorStreamHandler(colors=ColorFormatter.COLORS)
+        console_handler.setLevel(logging.DEBUG)
+        console_handler.setFormatter(formatter)
         
+        # The logger only queues records, the file and console writes happen on the
+        # listener thread
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        cls.queue_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+        cls.queue_listener.start()
+        # At exit (handlers run last first): drain the queue, then flush the file buffer
+        atexit.register(file_handler.flush)
+        atexit.register(cls.stop_queue_listener)
+
+        cls._shared_logger = logger
         return logger
-    
+
+    @classmethod
+    def stop_queue_listener(cls):
+        """
+        This function writes out the queued records and stops the listener thread
+        """
+        listener, cls.queue_listener = cls.queue_listener, None
+        if listener is not None:
+            listener.stop()
+
     @classmethod
     def get_log_file_name(cls):
         """
@@ -130,21 +130,9 @@ class CaptureConsoleLogs:
         if cls._log_file_name is not None:
             return cls._log_file_name
         return None
-    
+
     def count_down(self, duration):
         """
-        This function acts as count down timer
-
-        Args:
-            duration (_type_): _description_
+        This function acts as countdown timer
         """
-        while duration:
-            minutes, secs = divmod(duration, 60)
-            timer = f'{minutes} min :{secs} secs'
-            if duration % 10 == 0:
-                self.get_logger().info(f"Wait for: {timer}")
-            time.sleep(1)
-            duration -= 1
-
-            
-    
\ No newline at end of file
+        count_down(self.get_logger(), duration)